@@ -17,28 +17,31 @@ print(suite.get_prompt(
     params={"post": "Launching our new AI tool!", "hashtags": "#AI #Launch"}
 ))
 
-# 3. Create a new prompt
-print("\n✨ Creating new prompt 'product-review-generator'")
-print(suite.create_prompt(
-    name="product-review-generator",
-    parameters=["product_name", "rating"],
-    versions={
-        "gpt-4o": "Generate a review for {product_name} with a rating of {rating} stars.",
-        "gemini-pro": "You are a review expert. Write a {rating}-star review of {product_name}."
-    },
-    default="gemini-pro"
-))
-print(suite.get_prompt(name="product-review-generator",
-                       params={"product_name": "ps5", "rating": "5"}))
+# 3-4. Group several changes so the file is written only once
+with suite.batch():
+    # 3. Create a new prompt
+    print("\n✨ Creating new prompt 'product-review-generator'")
+    print(suite.create_prompt(
+        name="product-review-generator",
+        parameters=["product_name", "rating"],
+        versions={
+            "gpt-4o": "Generate a review for {product_name} with a rating of {rating} stars.",
+            "gemini-pro": "You are a review expert. Write a {rating}-star review of {product_name}."
+        },
+        default="gemini-pro"
+    ))
+    print(suite.get_prompt(name="product-review-generator",
+                           params={"product_name": "ps5", "rating": "5"}))
+
+    # 4. Add a new version to an existing prompt
+    print("\n➕ Adding new version 'claude-opus' to 'product-review-generator'")
+    print(suite.add_version(
+        name="product-review-generator",
+        version="claude-opus",
+        content="Review the product {product_name}. Rating: {rating} stars.",
+        set_as_default=True
+    ))
 
-# 4. Add a new version to an existing prompt
-print("\n➕ Adding new version 'claude-opus' to 'product-review-generator'")
-print(suite.add_version(
-    name="product-review-generator",
-    version="claude-opus",
-    content="Review the product {product_name}. Rating: {rating} stars.",
-    set_as_default=True
-))
 # 5. List available versions for a specific prompt
 print("\n📚 Listing versions for 'product-review-generator'")
 versions = suite.list_versions("product-review-generator")
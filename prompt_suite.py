@@ -1,10 +1,143 @@
-import yaml, json, os
+import os, re, secrets, threading
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Optional, Dict, Iterator, List
+
+# Parsed YAML files shared by every suite in the process: absolute path -> (file signature, prompts),
+# least recently used first. Only YAML is cached; copying cached data is far cheaper than parsing YAML,
+# but not than parsing JSON. At most _PARSE_CACHE_SIZE files are kept, since each is a full copy.
+# Guarded by _PARSE_CACHE_LOCK, since suites on different threads load and save concurrently.
+_PARSE_CACHE = OrderedDict()
+_PARSE_CACHE_SIZE = 8
+_PARSE_CACHE_LOCK = threading.Lock()
+
+# (loads, dumps) pairs per file format, imported on first use so a suite only pays for the format it works with.
+_backends = {}
+
+# Marker for "no value" in single-lookup dict operations.
+_MISSING = object()
+
+# Shared required-parameter set for prompts that declare no parameters.
+_NO_PARAMS = frozenset()
+
+# Matches '{name}' placeholders in prompt content; any key without braces can be a parameter name.
+# Shared with `prompt_suite_sql`, so both suites recognize the same placeholders.
+_PLACEHOLDER_RE = re.compile(r"\{([^{}]+)\}")
+
+
+def _compile_template(content: str):
+    """
+    Splits prompt content into its text parts and the positions of its placeholders.
+
+    Each placeholder keeps its original '{name}' text in the parts, so rendering only needs to
+    overwrite the slots whose parameter was provided and join the result (see `_render_template`).
+
+    Returns:
+        Optional[Tuple[Tuple[str, ...], Tuple[Tuple[int, str], ...]]]: The parts and the (index, parameter
+        name) slots, or None if the content has no placeholders and can be returned as is.
+    """
+    if "{" not in content:
+        return None
+    parts = []
+    slots = []
+    last = 0
+    for match in _PLACEHOLDER_RE.finditer(content):
+        parts.append(content[last:match.start()])
+        slots.append((len(parts), match.group(1)))
+        parts.append(match.group(0))
+        last = match.end()
+    if not slots:
+        return None
+    parts.append(content[last:])
+    return tuple(parts), tuple(slots)
+
+
+def _render_template(template, params: Dict[str, object]) -> str:
+    """
+    Fills a template compiled by `_compile_template` with the values in `params`.
+
+    Placeholders without a value are left untouched, and substituted values are never scanned again.
+    """
+    parts, slots = template
+    parts = list(parts)
+    for index, key in slots:
+        if key in params:
+            parts[index] = str(params[key])
+    return "".join(parts)
+
+
+class _PromptRecord:
+    """
+    In-memory data derived from one prompt definition: its required parameters and its compiled
+    templates per version. Built on first use and discarded whenever the prompt changes.
+    """
+    __slots__ = ("required", "templates")
+
+    def __init__(self, parameters: List[str]):
+        self.required = frozenset(parameters) if parameters else _NO_PARAMS
+        self.templates = {}
+
+
+def _copy_data(obj):
+    """Returns a copy of parsed file data, duplicating its dicts and lists and sharing immutable values."""
+    obj_type = type(obj)
+    if obj_type is dict:
+        return {k: _copy_data(v) for k, v in obj.items()}
+    if obj_type is list:
+        return [_copy_data(v) for v in obj]
+    return obj
+
+
+def _get_backend(file_format: str):
+    """
+    Returns the (loads, dumps) functions for a file format, importing its parser on first use.
+
+    `loads` parses the raw content of a file (bytes) and `dumps` serializes an object
+    to UTF-8 bytes.
+    JSON uses orjson when it is installed and YAML uses the libyaml bindings when they are available,
+    falling back to the standard json module and the pure-Python PyYAML classes respectively.
+    """
+    backend = _backends.get(file_format)
+    if backend is not None:
+        return backend
+
+    if file_format == "yaml":
+        import yaml
+        try:
+            from yaml import CSafeLoader as loader, CSafeDumper as dumper
+        except ImportError:
+            from yaml import SafeLoader as loader, SafeDumper as dumper
+
+        def loads(data) -> object:
+            return yaml.load(data, Loader=loader)
+
+        def dumps(obj) -> bytes:
+            return yaml.dump(obj, Dumper=dumper, allow_unicode=True, sort_keys=False, encoding="utf-8")
+    else:
+        try:
+            import orjson
+        except ImportError:
+            import json
+
+            def loads(data) -> object:
+                return json.loads(data)
+
+            def dumps(obj) -> bytes:
+                return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+        else:
+            loads = orjson.loads
+
+            def dumps(obj) -> bytes:
+                return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+    backend = _backends[file_format] = (loads, dumps)
+    return backend
 
 
 class PromptSuite:
-    def __init__(self, file_path: Optional[str] = None, file_format: Optional[str] = None):
+    def __init__(self, file_path: Optional[str] = None, file_format: Optional[str] = None,
+                 autosave: bool = True, render_cache_size: int = 0):
         """
         Initializes the PromptSuite with format detection and validation.
 
@@ -12,26 +145,40 @@ class PromptSuite:
             file_path (Optional[str]): Path to the prompt file. If not provided, defaults to 'prompts.yaml' in the project root.
             file_format (Optional[str]): Desired format to work with ('json' or 'yaml').
                                          If not provided, it will be inferred from the file extension.
+            autosave (bool): If True, every mutation is written to disk immediately. If False, changes are
+                             kept in memory until `flush()` is called.
+            render_cache_size (int): Maximum number of rendered prompts kept in an in-memory LRU cache, so
+                                     repeated `get_prompt` calls with the same arguments skip rendering.
+                                     0 (the default) disables the cache.
 
         Raises:
             RuntimeError: If initialization fails due to invalid configuration or loading issues.
         """
         try:
+            self._dirty = False
+            self._autosave = autosave
+            self._in_batch = False
+            self._file_sig = None
+            self._render_cache = OrderedDict()
+            self._render_cache_size = render_cache_size
+            self._render_cache_hits = 0
+            self._render_cache_misses = 0
             self.file_path = file_path or str(Path(__file__).parent.parent / "prompts.yaml")
 
             # Infer or validate format
             inferred_format = None
-            ext = os.path.splitext(self.file_path)[1].lower()
-            if ext == ".json":
+            lowered_path = self.file_path.lower()
+            if lowered_path.endswith(".json"):
                 inferred_format = "json"
-            elif ext in [".yaml", ".yml"]:
+            elif lowered_path.endswith((".yaml", ".yml")):
                 inferred_format = "yaml"
 
             if file_format:
                 self.format = file_format.lower()
-                if self.format not in ["json", "yaml"]:
+                if self.format not in ("json", "yaml"):
                     raise ValueError("Invalid format. Must be 'json' or 'yaml'.")
                 if inferred_format and self.format != inferred_format:
+                    ext = os.path.splitext(lowered_path)[1]
                     raise ValueError(
                         f"File extension '{ext}' does not match specified format '{self.format}'."
                     )
@@ -44,23 +191,121 @@ class PromptSuite:
             self._load_prompts()
 
         except Exception as e:
-            raise RuntimeError(f"Error initializing PromptSuite: {e}")
+            raise RuntimeError(f"Error initializing PromptSuite: {e}") from e
 
     def _load_prompts(self):
         """
         Loads prompts from the specified YAML or JSON file into memory.
 
         If the file exists, it parses the content based on the selected format ('yaml' or 'json')
-        and populates the `self.prompts` dictionary. If the file is empty or invalid, it initializes
-        with an empty dictionary.
+        and populates the `self.prompts` dictionary. If the file is empty, it initializes with an
+        empty dictionary. Every entry is normalized to the same shape `create_prompt` produces.
+        Parsing is skipped when the file has not changed since it was last loaded or saved, and YAML
+        files already parsed by another suite in this process are copied from a shared cache.
+
+        This method is intended for internal use only.
+
+        Returns:
+            bool: True if the prompts were (re)loaded, False if the file was unchanged.
+
+        Raises:
+            ValueError: If the file does not contain a mapping of prompts.
+        """
+        if self._file_sig is not None and self._file_signature() == self._file_sig:
+            return False
+        # Parsed into locals first, so a file that fails to parse leaves the loaded prompts untouched
+        prompts = {}
+        signature = None
+        try:
+            f = open(self.file_path, 'rb')
+        except FileNotFoundError:
+            pass
+        else:
+            with f:
+                # Taken from the open descriptor, so the signature always describes the content being read
+                st = os.fstat(f.fileno())
+                signature = st.st_mtime_ns, st.st_size
+                cache_key = self._parse_cache_key()
+                cached = None
+                if cache_key:
+                    with _PARSE_CACHE_LOCK:
+                        cached = _PARSE_CACHE.get(cache_key)
+                        if cached is not None and cached[0] == signature:
+                            _PARSE_CACHE.move_to_end(cache_key)
+                if cached is not None and cached[0] == signature:
+                    # Cached prompts are never modified, so they can be copied outside the lock
+                    prompts = _copy_data(cached[1])
+                else:
+                    loads, _ = _get_backend(self.format)
+                    data = loads(f.read())
+                    if data:
+                        prompts = self._normalize_prompts(data)
+                    if cache_key:
+                        entry = (signature, _copy_data(prompts))
+                        with _PARSE_CACHE_LOCK:
+                            _PARSE_CACHE[cache_key] = entry
+                            _PARSE_CACHE.move_to_end(cache_key)
+                            if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+                                _PARSE_CACHE.popitem(last=False)
+        self.prompts = prompts
+        self._records = {}
+        self._render_cache.clear()
+        self._file_sig = signature
+        return True
+
+    def _parse_cache_key(self) -> Optional[str]:
+        """
+        Returns the key of this suite's file in the shared parse cache, or None if its format is not cached.
+
+        This method is intended for internal use only.
+        """
+        return os.path.abspath(self.file_path) if self.format == "yaml" else None
+
+    def _file_signature(self):
+        """
+        Returns the (modification time, size) of the prompt file, or None if it does not exist.
+
+        This method is intended for internal use only.
+        """
+        try:
+            st = os.stat(self.file_path)
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    @staticmethod
+    def _normalize_prompts(data) -> Dict[str, dict]:
+        """
+        Ensures every loaded prompt has 'name', 'parameters' and 'versions' entries.
+
+        Files written by hand may omit optional keys; filling them in once at load time lets the
+        rest of the class access them directly. Identical prompt texts and parameter names are
+        collapsed into a single string object, since parsers allocate a new one per occurrence.
 
         This method is intended for internal use only.
         """
-        self.prompts = {}
-        if os.path.exists(self.file_path):
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f) if self.format == "yaml" else json.load(f)
-                self.prompts = data or {}
+        if not isinstance(data, dict):
+            raise ValueError("Prompt file must contain a mapping of prompt names to prompt definitions.")
+        pool = {}
+        for name, prompt_data in data.items():
+            if not isinstance(prompt_data, dict):
+                raise ValueError(f"Invalid definition for prompt '{name}'.")
+            prompt_data.setdefault("name", name)
+            parameters = prompt_data.get("parameters")
+            if parameters is None:
+                prompt_data["parameters"] = []
+            elif type(parameters) is list:
+                prompt_data["parameters"] = [pool.setdefault(p, p) if type(p) is str else p for p in parameters]
+            versions = prompt_data.get("versions")
+            if versions is None:
+                prompt_data["versions"] = {}
+            elif type(versions) is dict:
+                for version_data in versions.values():
+                    if type(version_data) is dict:
+                        content = version_data.get("prompt")
+                        if type(content) is str:
+                            version_data["prompt"] = pool.setdefault(content, content)
+        return data
 
     def _save_prompts(self):
         """
@@ -68,18 +313,157 @@ class PromptSuite:
 
         Serializes the `self.prompts` dictionary and writes it to the file defined in `self.file_path`,
         using the appropriate format ('yaml' or 'json'). Handles Unicode and formatting options accordingly.
+        The content is written to a temporary file that then replaces the original, so an interrupted
+        save never leaves a half-written prompt file behind.
 
         Raises:
             RuntimeError: If an error occurs while writing to the file.
         """
         try:
-            with open(self.file_path, 'w', encoding='utf-8') as f:
-                if self.format == "yaml":
-                    yaml.dump(self.prompts, f, allow_unicode=True, sort_keys=False)
-                else:
-                    json.dump(self.prompts, f, ensure_ascii=False, indent=2)
+            _, dumps = _get_backend(self.format)
+            self._write_atomic(dumps(self.prompts))
+            self._file_sig = self._file_signature()
+            cache_key = self._parse_cache_key()
+            if cache_key:
+                with _PARSE_CACHE_LOCK:
+                    _PARSE_CACHE.pop(cache_key, None)
         except Exception as e:
-            raise RuntimeError(f"Error saving prompts to file: {e}")
+            raise RuntimeError(f"Error saving prompts to file: {e}") from e
+
+    def _write_atomic(self, payload: bytes):
+        """
+        Writes `payload` to a temporary file next to the prompt file, syncs it and renames it over the original.
+
+        The permissions of an existing prompt file are preserved. On POSIX systems the containing directory
+        is synced as well, so the rename itself survives a crash.
+
+        This method is intended for internal use only.
+        """
+        try:
+            mode = os.stat(self.file_path).st_mode & 0o777
+        except FileNotFoundError:
+            mode = None
+        # A unique name, so concurrent saves of the same file never write into each other's temporary file.
+        # O_EXCL never reuses an existing file, and the 0o666 mode lets the kernel apply the umask to new files.
+        directory, base_name = os.path.split(os.path.abspath(self.file_path))
+        while True:
+            tmp_path = os.path.join(directory, f"{base_name}.{os.getpid()}.{secrets.token_hex(4)}.tmp")
+            try:
+                fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+                break
+            except FileExistsError:
+                continue
+        try:
+            try:
+                if mode is not None:
+                    if hasattr(os, "fchmod"):
+                        os.fchmod(fd, mode)
+                    else:
+                        os.chmod(tmp_path, mode)
+                view = memoryview(payload)
+                while view:
+                    written = os.write(fd, view)
+                    view = view[written:]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, self.file_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        if hasattr(os, "O_DIRECTORY"):
+            dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+
+    def _invalidate(self, name: str):
+        """
+        Drops the derived record and the rendered results cached for a prompt.
+
+        This method is intended for internal use only.
+        """
+        self._records.pop(name, None)
+        if self._render_cache:
+            for key in [key for key in self._render_cache if key[0] == name]:
+                del self._render_cache[key]
+
+    def _mark_dirty(self):
+        """
+        Flags the in-memory prompts as modified and saves them right away when autosave is enabled.
+
+        This method is intended for internal use only.
+        """
+        self._dirty = True
+        if self._autosave:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes pending changes to the prompt file. Does nothing if there are no unsaved changes.
+
+        Raises:
+            RuntimeError: If an error occurs while writing to the file.
+        """
+        if self._dirty:
+            self._save_prompts()
+            self._dirty = False
+
+    def reload(self) -> bool:
+        """
+        Re-reads the prompt file so the in-memory prompts match its current content.
+
+        The file is only parsed again if it changed on disk since it was last loaded or saved,
+        or if there are unsaved changes, which are discarded.
+
+        Returns:
+            bool: True if the file was parsed again, False if the prompts were already up to date.
+
+        Raises:
+            RuntimeError: If the file cannot be read or parsed. The prompts in memory, including any
+                          unsaved changes, are then left as they were.
+        """
+        if self._dirty:
+            self._file_sig = None
+        try:
+            reloaded = self._load_prompts()
+        except Exception as e:
+            raise RuntimeError(f"Error reloading prompts from file: {e}") from e
+        self._dirty = False
+        return reloaded
+
+    @contextmanager
+    def batch(self):
+        """
+        Groups several mutations so the prompt file is written only once, when the block exits.
+
+        Batches can be nested; only the outermost one writes the file.
+
+        Example:
+            with suite.batch():
+                suite.create_prompt(...)
+                suite.add_version(...)
+
+        Yields:
+            PromptSuite: This same instance.
+        """
+        if self._in_batch:
+            yield self
+            return
+        previous = self._autosave
+        self._autosave = False
+        self._in_batch = True
+        try:
+            yield self
+        finally:
+            self._in_batch = False
+            self._autosave = previous
+            self.flush()
 
     def create_prompt(self, name: str, versions: Dict[str, str], parameters: Optional[List[str]] = None,
                       default: Optional[str] = None):
@@ -99,17 +483,16 @@ class PromptSuite:
         Raises:
             ValueError: If a prompt with the same name already exists.
         """
-        if name in self.prompts:
-            raise ValueError("Prompt already exists.")
         data = {
             "name": name,
-            "parameters": parameters or [],
+            "parameters": [] if parameters is None else parameters,
             "versions": {k: {"prompt": v} for k, v in versions.items()}
         }
         if default:
             data["default"] = default
-        self.prompts[name] = data
-        self._save_prompts()
+        if self.prompts.setdefault(name, data) is not data:
+            raise ValueError("Prompt already exists.")
+        self._mark_dirty()
         return True
 
     def get_prompt(self, name: str, version: Optional[str] = None, params: Optional[Dict[str, str]] = None) -> str:
@@ -129,27 +512,77 @@ class PromptSuite:
                         if no default version is set when needed,
                         or if required parameters are missing.
         """
-        if name not in self.prompts:
+        if self._render_cache_size and params:
+            try:
+                key = (name, version, frozenset(params.items()))
+            except TypeError:  # unhashable parameter values are never cached
+                key = None
+            if key is not None:
+                cache = self._render_cache
+                prompt = cache.get(key)
+                if prompt is not None:
+                    cache.move_to_end(key)
+                    self._render_cache_hits += 1
+                    return prompt
+                self._render_cache_misses += 1
+                prompt = self._render_prompt(name, version, params)
+                # Only string values are cached: equal values of other types (1, 1.0, True) render differently.
+                if all(type(value) is str for value in params.values()):
+                    cache[key] = prompt
+                    if len(cache) > self._render_cache_size:
+                        cache.popitem(last=False)
+                return prompt
+        return self._render_prompt(name, version, params)
+
+    def cache_info(self) -> Dict[str, int]:
+        """
+        Returns statistics of the rendered-prompt cache enabled with `render_cache_size`.
+
+        Only calls that can use the cache are counted, i.e. calls with parameters while the cache is enabled.
+
+        Returns:
+            Dict[str, int]: The number of cache "hits" and "misses", the current "size" and the "maxsize".
+        """
+        return {
+            "hits": self._render_cache_hits,
+            "misses": self._render_cache_misses,
+            "size": len(self._render_cache),
+            "maxsize": self._render_cache_size,
+        }
+
+    def _render_prompt(self, name: str, version: Optional[str], params: Optional[Dict[str, str]]) -> str:
+        """
+        Resolves the prompt version, validates the parameters and fills in the placeholders.
+
+        This method is intended for internal use only; see `get_prompt` for arguments and errors.
+        """
+        prompt_data = self.prompts.get(name)
+        if prompt_data is None:
             raise ValueError(f"Prompt '{name}' not found.")
-        prompt_data = self.prompts[name]
         version = version or prompt_data.get("default")
         if not version:
             raise ValueError(f"No default version set for prompt '{name}'. Please specify a version.")
-        if version not in prompt_data["versions"]:
+        version_data = prompt_data["versions"].get(version)
+        if version_data is None:
             raise ValueError(f"Version '{version}' not found for prompt '{name}'.")
 
-        prompt = prompt_data["versions"][version]["prompt"]
-        expected_params = set(prompt_data.get("parameters", []))
-        if expected_params:
-            if not params:
-                raise ValueError(f"Missing required parameters: {', '.join(expected_params)}")
-
-            missing = expected_params - set(params.keys())
-            if missing:
-                raise ValueError(f"Missing required parameters: {', '.join(missing)}")
+        prompt = version_data["prompt"]
+        if not params and not prompt_data["parameters"]:
+            return prompt
+        record = self._records.get(name)
+        if record is None:
+            record = self._records[name] = _PromptRecord(prompt_data["parameters"])
+        expected_params = record.required
+        if expected_params and not (params and params.keys() >= expected_params):
+            missing = expected_params.difference(params) if params else expected_params
+            raise ValueError(f"Missing required parameters: {', '.join(missing)}")
         if params:
-            for k, v in params.items():
-                prompt = prompt.replace(f"{{{k}}}", str(v))
+            templates = record.templates
+            template = templates.get(version, _MISSING)
+            if template is _MISSING:
+                template = templates[version] = _compile_template(prompt)
+            if template is not None:
+                prompt = _render_template(template, params)
         return prompt
 
     def add_version(self, name: str, version: str, content: str, set_as_default: bool = False):
@@ -165,18 +598,19 @@ class PromptSuite:
         Raises:
             ValueError: If the prompt does not exist, or if the version already exists.
         """
-        if name not in self.prompts:
+        prompt_data = self.prompts.get(name)
+        if prompt_data is None:
             raise ValueError(f"Prompt '{name}' not found.")
 
-        if version in self.prompts[name]["versions"]:
+        entry = {"prompt": content}
+        if prompt_data["versions"].setdefault(version, entry) is not entry:
             raise ValueError(f"Version '{version}' already exists for prompt '{name}'.")
 
-        self.prompts[name]["versions"][version] = {"prompt": content}
-
         if set_as_default:
-            self.prompts[name]["default"] = version
+            prompt_data["default"] = version
+            self._invalidate(name)
 
-        self._save_prompts()
+        self._mark_dirty()
         return True
 
     def update_prompt(self, name: str, versions: Optional[Dict[str, str]] = None,
@@ -196,18 +630,18 @@ class PromptSuite:
         Returns:
             bool: True if the update was successful.
         """
-        if name not in self.prompts:
+        prompt = self.prompts.get(name)
+        if prompt is None:
             raise ValueError(f"Prompt '{name}' not found.")
-        else:
-            prompt = self.prompts[name]
-            if versions:
-                for k, v in versions.items():
-                    prompt["versions"][k] = {"prompt": v}
-            if parameters is not None:
-                prompt["parameters"] = parameters
-            if default is not None:
-                prompt["default"] = default
-            self._save_prompts()
+        self._invalidate(name)
+        if versions:
+            for k, v in versions.items():
+                prompt["versions"][k] = {"prompt": v}
+        if parameters is not None:
+            prompt["parameters"] = parameters
+        if default is not None:
+            prompt["default"] = default
+        self._mark_dirty()
         return True
 
     def rename_prompt(self, old_name: str, new_name: str):
@@ -224,15 +658,18 @@ class PromptSuite:
         Returns:
             bool: True if the rename operation was successful.
         """
-        if old_name not in self.prompts:
-            raise ValueError(f"Prompt '{old_name}' not found.")
         if new_name in self.prompts:
+            if old_name not in self.prompts:
+                raise ValueError(f"Prompt '{old_name}' not found.")
             raise ValueError(f"A prompt with the name '{new_name}' already exists.")
+        prompt_data = self.prompts.pop(old_name, None)
+        if prompt_data is None:
+            raise ValueError(f"Prompt '{old_name}' not found.")
 
-        prompt_data = self.prompts.pop(old_name)
+        self._invalidate(old_name)
         prompt_data["name"] = new_name  # actualiza el campo interno también
         self.prompts[new_name] = prompt_data
-        self._save_prompts()
+        self._mark_dirty()
         return True
 
     def delete_prompt(self, name: str):
@@ -248,11 +685,10 @@ class PromptSuite:
         Returns:
             bool: True if the prompt was successfully deleted.
         """
-        if name in self.prompts:
-            del self.prompts[name]
-            self._save_prompts()
-        else:
+        if self.prompts.pop(name, _MISSING) is _MISSING:
             raise ValueError(f"Prompt '{name}' not found.")
+        self._invalidate(name)
+        self._mark_dirty()
         return True
 
     def list_versions(self, name: str) -> List[str]:
@@ -268,9 +704,31 @@ class PromptSuite:
         Raises:
             ValueError: If the prompt does not exist.
         """
-        if name not in self.prompts:
+        prompt_data = self.prompts.get(name)
+        if prompt_data is None:
+            raise ValueError(f"Prompt '{name}' not found.")
+        return list(prompt_data["versions"])
+
+    def iter_versions(self, name: str) -> Iterator[str]:
+        """
+        Iterates over the model versions of the specified prompt without copying them into a list.
+
+        The prompt must not be changed while the iterator is being consumed; use `list_versions`
+        to get a snapshot instead.
+
+        Args:
+            name (str): The name of the prompt.
+
+        Returns:
+            Iterator[str]: An iterator over the version identifiers.
+
+        Raises:
+            ValueError: If the prompt does not exist.
+        """
+        prompt_data = self.prompts.get(name)
+        if prompt_data is None:
             raise ValueError(f"Prompt '{name}' not found.")
-        return list(self.prompts[name]["versions"].keys())
+        return iter(prompt_data["versions"])
 
     def get_default_version(self, name: str) -> Optional[str]:
         """
@@ -285,9 +743,10 @@ class PromptSuite:
         Raises:
             ValueError: If the prompt does not exist.
         """
-        if name not in self.prompts:
+        prompt_data = self.prompts.get(name)
+        if prompt_data is None:
             raise ValueError(f"Prompt '{name}' not found.")
-        return self.prompts[name].get("default")
+        return prompt_data.get("default")
 
     def list_prompts(self) -> List[str]:
         """
@@ -296,4 +755,16 @@ class PromptSuite:
         Returns:
             List[str]: A list containing the names of all available prompts.
         """
-        return list(self.prompts.keys())
+        return list(self.prompts)
+
+    def iter_prompts(self) -> Iterator[str]:
+        """
+        Iterates over the names of all stored prompts without copying them into a list.
+
+        Prompts must not be created, renamed or deleted while the iterator is being consumed;
+        use `list_prompts` to get a snapshot instead.
+
+        Returns:
+            Iterator[str]: An iterator over the prompt names.
+        """
+        return iter(self.prompts)
@@ -1,11 +1,254 @@
-from typing import Dict, List, Optional, Any
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 import json
+import sys
+
+from prompt_suite import _compile_template, _render_template
+
+# (De)serialization of the stored parameter lists; orjson is used when the 'fast' extra is installed.
+try:
+    import orjson
+except ImportError:
+    _dumps_json = json.dumps
+    _loads_json = json.loads
+else:
+    def _dumps_json(obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    _loads_json = orjson.loads
+
+# Compiled templates of the prompt texts read from the database, memoized by the text so each stored
+# prompt version is scanned once. The placeholder syntax is the file suite's.
+_compile_cached_template = lru_cache(maxsize=1024)(_compile_template)
+
+
+def _fill_placeholders(text: str, params: Dict[str, Any]) -> str:
+    """
+    Replaces every '{name}' placeholder that has a value in `params`, using the compiled template of `text`.
+
+    Placeholders without a value are left untouched, and substituted values are never scanned again.
+    """
+    template = _compile_cached_template(text)
+    if template is None:
+        return text
+    return _render_template(template, params)
+
+
+@lru_cache(maxsize=1024)
+def _required_parameters(parameters_json: Optional[str]) -> FrozenSet[str]:
+    """
+    Decodes a prompt's stored parameters JSON into the set of required parameter names.
+
+    Results are memoized by the JSON text, which is all they depend on, so repeated renders of the same
+    prompt skip the JSON parser; the frozenset keeps the shared result immutable and lets a render check
+    all its parameters with a single subset test.
+    """
+    return frozenset(_loads_json(parameters_json or "[]"))
+
+
+def _values_getter(names: Tuple[str, ...]):
+    """
+    Returns a function that takes a parameter dict and returns the values of `names`, in order, as a tuple.
+
+    A missing name raises KeyError.
+    """
+    if not names:
+        return lambda params: ()
+    if len(names) == 1:
+        name = names[0]
+        return lambda params: (params[name],)
+    return itemgetter(*names)
+
+
+@lru_cache(maxsize=None)
+def _sqlite_supports_returning() -> bool:
+    """
+    Returns True if the SQLite library bundled with Python supports INSERT ... RETURNING (3.35+).
+    """
+    try:
+        import sqlite3
+    except ImportError:
+        return False
+    return sqlite3.sqlite_version_info >= (3, 35, 0)
+
+
+def _driver_paramstyle(module_name: str) -> str:
+    """
+    Returns the DB-API paramstyle declared by the driver that defines a connection class, defaulting to 'qmark'.
+
+    `module_name` is the module of the connection class. The paramstyle is looked up in it and then in
+    each enclosing package, since drivers declare it on the package that is their DB-API module
+    (e.g. 'mysql.connector' for 'mysql.connector.connection_cext').
+    """
+    while module_name:
+        paramstyle = getattr(sys.modules.get(module_name), "paramstyle", None)
+        if paramstyle is not None:
+            return paramstyle
+        module_name = module_name.rpartition(".")[0]
+    return "qmark"
+
+
+# Rows per statement when prompts are inserted or looked up in chunks, which keeps the bound values
+# below SQLite's historical limit of 999 variables.
+_BULK_CHUNK_SIZE = 300
+
+# Driver modules that connect to PostgreSQL.
+_POSTGRES_DRIVERS = frozenset({"psycopg2", "psycopg"})
+
+# Applied by `_tune_connection` to SQLite connections: WAL lets readers run while a write commits,
+# which makes synchronous=NORMAL safe, and reads go through a memory map instead of the pager.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL;",
+    "PRAGMA synchronous=NORMAL;",
+    "PRAGMA temp_store=MEMORY;",
+    "PRAGMA mmap_size=268435456;",
+)
+
+# Queries every custom query set must define.
+_REQUIRED_QUERY_KEYS = frozenset({
+    "get_prompt_by_name",
+    "get_versions_by_prompt",
+    "get_version_content",
+    "create_prompt",
+    "create_version",
+    "update_prompt",
+    "delete_prompt",
+    "rename_prompt"
+})
+
+# Default queries for the tables created by `_create_default_tables`; '{prompts_table}' and
+# '{versions_table}' are replaced with the instance's table names. Placeholders are positional ('?',
+# or '%s' for drivers with the format/pyformat paramstyle) and bound in the order of "params".
+_DEFAULT_QUERIES = {
+    "get_prompt_by_name": {
+        "query": (
+            "SELECT id, prompt_name, parameters, default_version "
+            "FROM {prompts_table} WHERE prompt_name = ?;"
+        ),
+        "params": ["prompt_name"]
+    },
+    "get_versions_by_prompt": {
+        "query": (
+            "SELECT version FROM {versions_table} "
+            "WHERE prompt_id = ?;"
+        ),
+        "params": ["prompt_id"]
+    },
+    "get_version_content": {
+        "query": (
+            "SELECT prompt_text FROM {versions_table} "
+            "WHERE prompt_id = ? AND version = ?;"
+        ),
+        "params": ["prompt_id", "version"]
+    },
+    "get_prompt_rendered": {
+        "query": (
+            "SELECT p.parameters, COALESCE(?, p.default_version), v.prompt_text "
+            "FROM {prompts_table} p LEFT JOIN {versions_table} v "
+            "ON v.prompt_id = p.id AND v.version = COALESCE(?, p.default_version) "
+            "WHERE p.prompt_name = ?;"
+        ),
+        "params": ["version", "version", "prompt_name"]
+    },
+    "get_all_prompts": {
+        "query": (
+            "SELECT prompt_name FROM {prompts_table};"
+        ),
+        "params": []
+    },
+    "get_all_prompts_with_versions": {
+        "query": (
+            "SELECT p.prompt_name, p.parameters, p.default_version, v.version, v.prompt_text "
+            "FROM {prompts_table} p LEFT JOIN {versions_table} v ON v.prompt_id = p.id "
+            "ORDER BY p.id, v.id;"
+        ),
+        "params": []
+    },
+    "get_all_default_prompts": {
+        "query": (
+            "SELECT p.prompt_name, p.parameters, p.default_version, v.prompt_text "
+            "FROM {prompts_table} p LEFT JOIN {versions_table} v "
+            "ON v.prompt_id = p.id AND v.version = p.default_version;"
+        ),
+        "params": []
+    },
+    "prompt_exists": {
+        "query": (
+            "SELECT 1 FROM {prompts_table} WHERE prompt_name = ? LIMIT 1;"
+        ),
+        "params": ["prompt_name"]
+    },
+    "get_prompt_id_by_name": {
+        "query": (
+            "SELECT id FROM {prompts_table} WHERE prompt_name = ?;"
+        ),
+        "params": ["prompt_name"]
+    },
+    "create_prompt": {
+        "query": (
+            "INSERT INTO {prompts_table} (prompt_name, parameters, default_version) "
+            "VALUES (?, ?, ?);"
+        ),
+        "params": ["prompt_name", "parameters", "default_version"]
+    },
+    "create_version": {
+        "query": (
+            "INSERT INTO {versions_table} (prompt_id, version, prompt_text) "
+            "VALUES (?, ?, ?);"
+        ),
+        "params": ["prompt_id", "version", "prompt_text"]
+    },
+    "update_prompt": {
+        "query": (
+            "UPDATE {prompts_table} SET parameters = ?, default_version = ? "
+            "WHERE id = ?;"
+        ),
+        "params": ["parameters", "default_version", "id"]
+    },
+    "delete_prompt": {
+        "query": (
+            "DELETE FROM {prompts_table} WHERE prompt_name = ?;"
+        ),
+        "params": ["prompt_name"]
+    },
+    "rename_prompt": {
+        "query": (
+            "UPDATE {prompts_table} SET prompt_name = ? WHERE prompt_name = ?;"
+        ),
+        "params": ["new_name", "old_name"]
+    }
+}
+
+# Insert-if-absent in a single statement; no row is returned when the name/version is taken.
+# Only used when the database supports RETURNING (see `PromptSuiteSQL._supports_returning`).
+_RETURNING_QUERIES = {
+    "create_prompt_if_absent": {
+        "query": (
+            "INSERT INTO {prompts_table} (prompt_name, parameters, default_version) "
+            "VALUES (?, ?, ?) "
+            "ON CONFLICT(prompt_name) DO NOTHING RETURNING id;"
+        ),
+        "params": ["prompt_name", "parameters", "default_version"]
+    },
+    "create_version_if_absent": {
+        "query": (
+            "INSERT INTO {versions_table} (prompt_id, version, prompt_text) "
+            "SELECT id, ?, ? FROM {prompts_table} WHERE prompt_name = ? "
+            "ON CONFLICT(prompt_id, version) DO NOTHING RETURNING id;"
+        ),
+        "params": ["version", "prompt_text", "prompt_name"]
+    }
+}
 
 
 class PromptSuiteSQL:
     def __init__(self, connection, auto_setup: bool = True,
                  custom_queries: Optional[Dict[str, str]] = None,
-                 table_suffix: str = ""):
+                 table_suffix: str = "", prompt_cache_size: int = 0,
+                 tune_connection: bool = False):
         """
         Initializes the SQL-based PromptSuite.
 
@@ -14,6 +257,14 @@ class PromptSuiteSQL:
             auto_setup (bool): If True, creates necessary tables with default queries.
             custom_queries (Optional[Dict[str, str]]): Required if auto_setup is False.
             table_suffix (str): Optional suffix added to table names for isolation (e.g. "_dev", "_test").
+            prompt_cache_size (int): Maximum number of resolved prompt versions kept in an in-memory LRU cache,
+                                     so repeated `get_prompt` calls skip the database. The cache is cleared
+                                     by this instance's writes only, so keep it disabled when other
+                                     connections modify the prompts. 0 (the default) disables the cache.
+            tune_connection (bool): If True and the connection is a sqlite3 connection, applies PRAGMAs for
+                                    faster writes and reads (WAL journal, synchronous=NORMAL, in-memory temp
+                                    storage, memory-mapped reads). WAL mode is stored in the database file
+                                    and affects every other connection to it. Ignored for other drivers.
 
         Raises:
             RuntimeError: If initialization fails or required custom queries are missing.
@@ -21,22 +272,34 @@ class PromptSuiteSQL:
         try:
             self.conn = connection
             self.cursor = self.conn.cursor()
+            # Top-level module of the DB-API driver (e.g. 'sqlite3', 'psycopg2'), used to specialize the SQL
+            self._driver = type(connection).__module__.partition(".")[0]
+            # Positional placeholder of the driver, used in the default queries and the bulk statements
+            if _driver_paramstyle(type(connection).__module__) in ("format", "pyformat"):
+                self._placeholder = "%s"
+            else:
+                self._placeholder = "?"
             self.auto_setup = auto_setup
             self.table_suffix = table_suffix
 
             self.prompts_table = f"prompts{self.table_suffix}"
             self.versions_table = f"prompt_versions{self.table_suffix}"
 
-            self.required_query_keys = [
-                "get_prompt_by_name",
-                "get_versions_by_prompt",
-                "get_version_content",
-                "create_prompt",
-                "create_version",
-                "update_prompt",
-                "delete_prompt",
-                "rename_prompt"
-            ]
+            # Executable SQL per query key, formatted on first use and reused afterwards
+            self._statements = {}
+
+            self._in_transaction = False
+
+            # (prompt_name, version) -> (parameters JSON, prompt text), most recently used last
+            self._prompt_cache = OrderedDict()
+            self._prompt_cache_size = prompt_cache_size
+            self._prompt_cache_hits = 0
+            self._prompt_cache_misses = 0
+
+            self.required_query_keys = _REQUIRED_QUERY_KEYS
+
+            if tune_connection:
+                self._tune_connection()
 
             if auto_setup:
                 self._create_default_tables()
@@ -44,21 +307,36 @@ class PromptSuiteSQL:
             else:
                 if not custom_queries:
                     raise RuntimeError("custom_queries must be provided when auto_setup=False.")
-                missing = set(self.required_query_keys) - set(custom_queries.keys())
+                missing = self.required_query_keys.difference(custom_queries)
                 if missing:
                     raise RuntimeError(f"Missing required queries: {', '.join(missing)}")
                 self.queries = custom_queries
 
         except Exception as e:
-            raise RuntimeError(f"Error initializing PromptSuiteSQL: {e}")
+            raise RuntimeError(f"Error initializing PromptSuiteSQL: {e}") from e
+
+    def _tune_connection(self):
+        """
+        Applies the `_SQLITE_PRAGMAS` settings when the connection comes from the sqlite3 module.
+
+        This method is intended for internal use only.
+        """
+        if self._driver != "sqlite3":
+            return
+        for pragma in _SQLITE_PRAGMAS:
+            self.cursor.execute(pragma)
 
     def _create_default_tables(self):
-        prompts_table = f"prompts_{self.table_suffix}"
-        versions_table = f"prompt_versions_{self.table_suffix}"
+        prompts_table = self.prompts_table
+        versions_table = self.versions_table
+        if self._driver in _POSTGRES_DRIVERS:
+            id_column = "id SERIAL PRIMARY KEY"
+        else:
+            id_column = "id INTEGER PRIMARY KEY AUTOINCREMENT"
 
         self.cursor.execute(f"""
             CREATE TABLE IF NOT EXISTS {prompts_table} (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                {id_column},
                 prompt_name TEXT UNIQUE NOT NULL,
                 parameters TEXT,  -- comma-separated list of parameter names
                 default_version TEXT
@@ -66,85 +344,217 @@ class PromptSuiteSQL:
         """)
         self.cursor.execute(f"""
             CREATE TABLE IF NOT EXISTS {versions_table} (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                {id_column},
                 prompt_id INTEGER,
                 version TEXT NOT NULL,
                 prompt_text TEXT NOT NULL,
                 FOREIGN KEY(prompt_id) REFERENCES {prompts_table}(id) ON DELETE CASCADE
             );
         """)
+        self.cursor.execute(f"""
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_{versions_table}_prompt_version
+            ON {versions_table} (prompt_id, version);
+        """)
         self.conn.commit()
 
     def _default_queries(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the default queries specialized once for the connection's driver: the RETURNING-based
+        inserts are included when the database supports them, and the placeholders follow the driver's
+        paramstyle.
+
+        This method is intended for internal use only.
+        """
+        # Copies of the query dicts and their parameter lists, so changing one instance's queries never
+        # alters the module defaults
+        templates = dict(_DEFAULT_QUERIES)
+        if self._supports_returning():
+            templates.update(_RETURNING_QUERIES)
         return {
-            "get_prompt_by_name": {
-                "query": (
-                    "SELECT id, prompt_name, parameters, default_version "
-                    "FROM {prompts_table} WHERE prompt_name = :prompt_name;"
-                ),
-                "params": ["prompt_name"]
-            },
-            "get_versions_by_prompt": {
-                "query": (
-                    "SELECT version FROM {versions_table} "
-                    "WHERE prompt_id = :prompt_id;"
-                ),
-                "params": ["prompt_id"]
-            },
-            "get_version_content": {
-                "query": (
-                    "SELECT prompt_text FROM {versions_table} "
-                    "WHERE prompt_id = :prompt_id AND version = :version;"
-                ),
-                "params": ["prompt_id", "version"]
-            },
-            "get_all_prompts": {
-                "query": (
-                    "SELECT prompt_name FROM {prompts_table};"
-                ),
-                "params": []
-            },
-            "get_prompt_id_by_name": {
-                "query": (
-                    "SELECT id FROM {prompts_table} WHERE prompt_name = :prompt_name;"
-                ),
-                "params": ["prompt_name"]
-            },
-            "create_prompt": {
-                "query": (
-                    "INSERT INTO {prompts_table} (prompt_name, parameters, default_version) "
-                    "VALUES (:prompt_name, :parameters, :default_version);"
-                ),
-                "params": ["prompt_name", "parameters", "default_version"]
-            },
-            "create_version": {
-                "query": (
-                    "INSERT INTO {versions_table} (prompt_id, version, prompt_text) "
-                    "VALUES (:prompt_id, :version, :prompt_text);"
-                ),
-                "params": ["prompt_id", "version", "prompt_text"]
-            },
-            "update_prompt": {
-                "query": (
-                    "UPDATE {prompts_table} SET parameters = :parameters, default_version = :default_version "
-                    "WHERE id = :id;"
-                ),
-                "params": ["parameters", "default_version", "id"]
-            },
-            "delete_prompt": {
-                "query": (
-                    "DELETE FROM {prompts_table} WHERE prompt_name = :prompt_name;"
-                ),
-                "params": ["prompt_name"]
-            },
-            "rename_prompt": {
-                "query": (
-                    "UPDATE {prompts_table} SET prompt_name = :new_name WHERE prompt_name = :old_name;"
-                ),
-                "params": ["new_name", "old_name"]
-            }
+            key: dict(
+                query_obj,
+                query=query_obj["query"].replace("?", self._placeholder),
+                params=list(query_obj["params"])
+            )
+            for key, query_obj in templates.items()
         }
 
+    def _supports_returning(self) -> bool:
+        """
+        Returns True if the connected database supports INSERT ... ON CONFLICT ... RETURNING.
+
+        This method is intended for internal use only.
+        """
+        if self._driver in _POSTGRES_DRIVERS:
+            return True
+        return self._driver == "sqlite3" and _sqlite_supports_returning()
+
+    def _connection_in_transaction(self) -> Optional[bool]:
+        """
+        Returns True if the connection has a transaction open, or None if its driver does not report it.
+
+        This method is intended for internal use only.
+        """
+        if self._driver == "sqlite3":
+            return self.conn.in_transaction
+        # psycopg2 and psycopg report 0 (IDLE) when no transaction is open
+        if self._driver == "psycopg2":
+            return self.conn.get_transaction_status() != 0
+        if self._driver == "psycopg":
+            return self.conn.info.transaction_status != 0
+        return None
+
+    def _connection_autocommits(self) -> bool:
+        """
+        Returns True if the connection commits every statement unless a transaction is begun explicitly.
+
+        This method is intended for internal use only.
+        """
+        autocommit = getattr(self.conn, "autocommit", None)
+        if self._driver == "sqlite3" and autocommit is not True and autocommit is not False:
+            # Legacy transaction control (the only mode before Python 3.12)
+            return self.conn.isolation_level is None
+        return autocommit is True
+
+    @contextmanager
+    def transaction(self):
+        """
+        Runs the writes of the block as one transaction: it is committed once when the block completes
+        and rolled back if the block raises, so a failed write never leaves partial changes pending.
+
+        Every write method uses its own transaction; wrapping several calls in one block commits them
+        together, which is much faster for imports and migrations. Transactions can be nested; only the
+        outermost one commits or rolls back. Let errors propagate out of the block: a write that fails
+        inside it is only undone when the whole block is rolled back.
+
+        With sqlite3, psycopg2 and psycopg connections, a transaction is begun explicitly on autocommit
+        connections, and when the connection already has one open the block runs in a savepoint instead,
+        so a rollback only discards the block's own changes and keeps the other pending work of the
+        connection. Other drivers do not report their transaction state, so the block simply ends with
+        the connection's commit() or rollback().
+
+        Example:
+            with db.transaction():
+                db.create_prompt(...)
+                db.add_version(...)
+
+        Yields:
+            PromptSuiteSQL: This same instance.
+        """
+        if self._in_transaction:
+            yield self
+            return
+        # SAVEPOINT and BEGIN are only issued when the driver reports the connection's state; for
+        # other drivers the portable commit() and rollback() are used as is
+        state = self._connection_in_transaction()
+        in_transaction = state is True
+        explicit = state is False and self._connection_autocommits()
+        cursor = self.cursor
+        if in_transaction:
+            cursor.execute("SAVEPOINT prompt_suite;")
+        elif explicit:
+            cursor.execute("BEGIN;")
+        self._in_transaction = True
+        try:
+            yield self
+            if in_transaction:
+                cursor.execute("RELEASE SAVEPOINT prompt_suite;")
+                self.conn.commit()
+            elif explicit:
+                cursor.execute("COMMIT;")
+            else:
+                self.conn.commit()
+        except BaseException:
+            if in_transaction:
+                cursor.execute("ROLLBACK TO SAVEPOINT prompt_suite;")
+                cursor.execute("RELEASE SAVEPOINT prompt_suite;")
+            elif explicit:
+                cursor.execute("ROLLBACK;")
+            else:
+                self.conn.rollback()
+            # Lookups cached inside the block may reflect changes that were just discarded
+            self._prompt_cache.clear()
+            raise
+        finally:
+            self._in_transaction = False
+
+    def _prepare_query(self, key: str):
+        """
+        Looks up a query by key and fills in the table name placeholders.
+
+        The result is cached per key, so every execution passes the very same SQL string to the driver
+        (which keeps driver-side statement caches warm) and the formatting only happens once.
+
+        Args:
+            key (str): The query name in self.queries.
+
+        Returns:
+            Tuple[str, Tuple[str, ...], Callable]: The executable SQL, the ordered parameter names it expects
+            and a function that picks their values from a parameter dict (see `_values_getter`).
+
+        Raises:
+            KeyError: If the query is not defined.
+            RuntimeError: If the table placeholders cannot be formatted.
+        """
+        statement = self._statements.get(key)
+        if statement is not None:
+            return statement
+
+        if key not in self.queries:
+            raise KeyError(f"Query '{key}' not defined.")
+
+        query_obj = self.queries[key]
+
+        # Format table names; str.format ignores the ones the query does not use
+        try:
+            query = query_obj["query"].format(
+                prompts_table=self.prompts_table,
+                versions_table=self.versions_table,
+            )
+        except KeyError as e:
+            raise RuntimeError(f"Missing table placeholder in query '{key}': {e}") from e
+        except (ValueError, IndexError) as e:
+            raise RuntimeError(f"Invalid placeholder syntax in query '{key}': {e}") from e
+        except Exception as e:
+            raise RuntimeError(f"Unexpected error formatting query '{key}': {e}") from e
+
+        expected_params = tuple(query_obj["params"])
+        statement = self._statements[key] = (query, expected_params, _values_getter(expected_params))
+        return statement
+
+    @staticmethod
+    def _missing_params_error(key: str, expected_params: Tuple[str, ...], params: Dict[str, Any]) -> ValueError:
+        """
+        Builds the error reported when a parameter set lacks some of the expected parameters.
+
+        This method is intended for internal use only.
+        """
+        missing = [k for k in expected_params if k not in params]
+        return ValueError(f"Missing parameters for query '{key}': {', '.join(missing)}")
+
+    def _run_many(self, key: str, params_list: List[Dict[str, Any]]):
+        """
+        Executes a query by key once per parameter set, using a single executemany call.
+
+        Args:
+            key (str): The query name in self.queries.
+            params_list (List[Dict[str, Any]]): The values for each execution.
+
+        Raises:
+            RuntimeError: If the query execution fails or parameters are missing.
+        """
+        try:
+            query, expected_params, get_values = self._prepare_query(key)
+            try:
+                rows = [get_values(params) for params in params_list]
+            except KeyError:
+                params = next(p for p in params_list if not all(k in p for k in expected_params))
+                raise self._missing_params_error(key, expected_params, params) from None
+            self.cursor.executemany(query, rows)
+
+        except Exception as e:
+            raise RuntimeError(f"Error running query '{key}': {e}") from e
+
     def _run_query(self, key: str, params: Dict[str, Any], fetch: str = "none"):
         """
         Executes a query by key using its param list and returns optional results.
@@ -152,45 +562,23 @@ class PromptSuiteSQL:
         Args:
             key (str): The query name in self.queries.
             params (Dict[str, Any]): The values for the query.
-            fetch (str): Can be 'one', 'all' or 'none'.
+            fetch (str): Can be 'one', 'all', 'col0' (a list of the first column of every row), 'iter' (an
+                         iterator over the rows, which must be consumed before the next query runs) or 'none'.
 
         Returns:
-            Any: Fetched results if fetch is 'one' or 'all', otherwise None.
+            Any: Fetched results if fetch is 'one', 'all', 'col0' or 'iter', otherwise None.
 
         Raises:
             RuntimeError: If the query execution fails or parameters are missing.
         """
         try:
-            if key not in self.queries:
-                raise KeyError(f"Query '{key}' not defined.")
-
-            query_obj = self.queries[key]
-            raw_query = query_obj["query"]
-            expected_params = query_obj["params"]
-
-            # Validate required parameters
-            missing = [k for k in expected_params if k not in params]
-            if missing:
-                raise ValueError(f"Missing parameters for query '{key}': {', '.join(missing)}")
-
-            # Format table names if used in the query
-            placeholders = {
-                "prompts_table": self.prompts_table,
-                "versions_table": self.versions_table,
-            }
-            try:
-                query = raw_query.format(**{
-                    k: v for k, v in placeholders.items() if f"{{{k}}}" in raw_query
-                })
-            except KeyError as e:
-                raise RuntimeError(f"Missing table placeholder in query '{key}': {e}")
-            except (ValueError, IndexError) as e:
-                raise RuntimeError(f"Invalid placeholder syntax in query '{key}': {e}")
-            except Exception as e:
-                raise RuntimeError(f"Unexpected error formatting query '{key}': {e}")
+            query, expected_params, get_values = self._prepare_query(key)
 
             # Order parameter values
-            values = tuple(params[k] for k in expected_params)
+            try:
+                values = get_values(params)
+            except KeyError:
+                raise self._missing_params_error(key, expected_params, params) from None
 
             # Execute query
             self.cursor.execute(query, values)
@@ -199,10 +587,26 @@ class PromptSuiteSQL:
                 return self.cursor.fetchone()
             elif fetch == "all":
                 return self.cursor.fetchall()
+            elif fetch == "col0":
+                # Built straight from the cursor's rows, without an intermediate fetchall() list
+                return [row[0] for row in self.cursor]
+            elif fetch == "iter":
+                # Rows are read from the driver as they are consumed, never held in a list all at once
+                return iter(self.cursor)
             return None
 
         except Exception as e:
-            raise RuntimeError(f"Error running query '{key}': {e}")
+            raise RuntimeError(f"Error running query '{key}': {e}") from e
+
+    def _prompt_exists(self, prompt_name: str) -> bool:
+        """
+        Checks whether a prompt exists, with the lightweight 'prompt_exists' query when it is defined and
+        with 'get_prompt_by_name' otherwise.
+
+        This method is intended for internal use only.
+        """
+        key = "prompt_exists" if "prompt_exists" in self.queries else "get_prompt_by_name"
+        return self._run_query(key, {"prompt_name": prompt_name}, fetch="one") is not None
 
     def create_prompt(self, prompt_name: str, versions: Dict[str, str],
                       parameters: Optional[List[str]] = None,
@@ -223,42 +627,162 @@ class PromptSuiteSQL:
             RuntimeError: If the prompt already exists or any step fails.
         """
         try:
-            # Check if the prompt already exists
-            existing = self._run_query("get_prompt_by_name", {"prompt_name": prompt_name}, fetch="one")
-            if existing:
-                raise RuntimeError(f"Prompt '{prompt_name}' already exists.")
+            with self.transaction():
+                prompt_values = {
+                    "prompt_name": prompt_name,
+                    "parameters": _dumps_json(parameters or []),
+                    "default_version": default
+                }
+
+                if "create_prompt_if_absent" in self.queries:
+                    # Insert the prompt and get its ID in one statement; no row means the name is taken
+                    result = self._run_query("create_prompt_if_absent", prompt_values, fetch="one")
+                    if not result:
+                        raise RuntimeError(f"Prompt '{prompt_name}' already exists.")
+                else:
+                    # Check if the prompt already exists
+                    if self._prompt_exists(prompt_name):
+                        raise RuntimeError(f"Prompt '{prompt_name}' already exists.")
+
+                    # Insert prompt into DB
+                    self._run_query("create_prompt", prompt_values)
+
+                    # Retrieve the prompt ID
+                    result = self._run_query("get_prompt_id_by_name", {"prompt_name": prompt_name}, fetch="one")
+                    if not result:
+                        raise RuntimeError(f"Failed to retrieve ID for prompt '{prompt_name}'.")
+                prompt_id = result[0]
+
+                # Insert all versions in one batch
+                self._run_many("create_version", [
+                    {"prompt_id": prompt_id, "version": version, "prompt_text": text}
+                    for version, text in versions.items()
+                ])
+
+                return True
 
-            # Serialize parameters
-            param_str = json.dumps(parameters or [])
+        except Exception as e:
+            raise RuntimeError(f"Error creating prompt '{prompt_name}': {e}") from e
 
-            # Insert prompt into DB
-            self._run_query("create_prompt", {
-                "prompt_name": prompt_name,
-                "parameters": param_str,
-                "default_version": default
-            })
-
-            # Retrieve the prompt ID
-            result = self._run_query("get_prompt_id_by_name", {"prompt_name": prompt_name}, fetch="one")
-            if not result:
-                raise RuntimeError(f"Failed to retrieve ID for prompt '{prompt_name}'.")
-            prompt_id = result[0]
-
-            # Insert each version
-            for version, text in versions.items():
-                self._run_query("create_version", {
-                    "prompt_id": prompt_id,
-                    "version": version,
-                    "prompt_text": text
-                })
+    def create_prompts_bulk(self, prompts: List[Dict[str, Any]]) -> bool:
+        """
+        Creates several prompts at once, in a single transaction.
 
-            self.conn.commit()
-            return True
+        With the default tables, prompts are inserted and their IDs resolved with one statement per few
+        hundred prompts (a multi-row INSERT ... RETURNING when the database supports it, chunked
+        'IN (...)' lookups otherwise), and all versions with one executemany call, instead of a few
+        statements per prompt. Custom query sets look prompts up one name at a time. If any prompt
+        fails, none of them is created.
+
+        Args:
+            prompts (List[Dict[str, Any]]): One dictionary per prompt with the `create_prompt` arguments:
+                "prompt_name" and "versions", plus the optional "parameters" and "default".
+
+        Returns:
+            bool: True if all prompts and versions were successfully created.
+
+        Raises:
+            RuntimeError: If a prompt name is repeated or already exists, or any step fails.
+        """
+        try:
+            names = [prompt["prompt_name"] for prompt in prompts]
+            seen = set()
+            for name in names:
+                if name in seen:
+                    raise RuntimeError(f"Prompt '{name}' is given more than once.")
+                seen.add(name)
+
+            prompt_rows = [
+                {
+                    "prompt_name": prompt["prompt_name"],
+                    "parameters": _dumps_json(prompt.get("parameters") or []),
+                    "default_version": prompt.get("default")
+                }
+                for prompt in prompts
+            ]
+
+            with self.transaction():
+                if self.auto_setup and self._supports_returning():
+                    # Insert the prompts and get their IDs together; names already taken return no row
+                    prompt_ids = self._insert_prompts_returning_ids(prompt_rows)
+                    if len(prompt_ids) != len(names):
+                        missing = next(name for name in names if name not in prompt_ids)
+                        raise RuntimeError(f"Prompt '{missing}' already exists.")
+                else:
+                    existing = self._prompt_ids(names)
+                    if existing:
+                        raise RuntimeError(f"Prompt '{next(iter(existing))}' already exists.")
+
+                    # Insert all prompts in one batch, then look up their IDs
+                    self._run_many("create_prompt", prompt_rows)
+                    prompt_ids = self._prompt_ids(names)
+                    if len(prompt_ids) != len(names):
+                        missing = next(name for name in names if name not in prompt_ids)
+                        raise RuntimeError(f"Failed to retrieve ID for prompt '{missing}'.")
+
+                # Insert the versions of every prompt in one batch
+                self._run_many("create_version", [
+                    {"prompt_id": prompt_ids[prompt["prompt_name"]], "version": version, "prompt_text": text}
+                    for prompt in prompts
+                    for version, text in prompt["versions"].items()
+                ])
+
+                return True
 
         except Exception as e:
-            raise RuntimeError(f"Error creating prompt '{prompt_name}': {e}")
+            raise RuntimeError(f"Error creating prompts: {e}") from e
 
-    import json
+    def _insert_prompts_returning_ids(self, prompt_rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Inserts prompt rows into the default prompts table with one multi-row INSERT ... ON CONFLICT DO
+        NOTHING RETURNING statement per chunk of `_BULK_CHUNK_SIZE` rows.
+
+        This method is intended for internal use only.
+
+        Returns:
+            Dict[str, Any]: The IDs of the inserted prompts keyed by name; names that were already taken
+            are missing.
+        """
+        prompt_ids = {}
+        row_placeholders = f"({self._placeholder}, {self._placeholder}, {self._placeholder})"
+        for start in range(0, len(prompt_rows), _BULK_CHUNK_SIZE):
+            chunk = prompt_rows[start:start + _BULK_CHUNK_SIZE]
+            self.cursor.execute(
+                f"INSERT INTO {self.prompts_table} (prompt_name, parameters, default_version) "
+                f"VALUES {', '.join([row_placeholders] * len(chunk))} "
+                f"ON CONFLICT(prompt_name) DO NOTHING RETURNING prompt_name, id;",
+                [value for row in chunk for value in (row["prompt_name"], row["parameters"], row["default_version"])]
+            )
+            prompt_ids.update(self.cursor.fetchall())
+        return prompt_ids
+
+    def _prompt_ids(self, names: List[str]) -> Dict[str, Any]:
+        """
+        Returns the IDs of the given prompts that exist, keyed by name.
+
+        With the default tables, the names are looked up with one 'IN (...)' query per chunk of
+        `_BULK_CHUNK_SIZE` names; custom query sets run one 'get_prompt_id_by_name' query per name.
+        Both are answered by the unique index on the prompt name.
+
+        This method is intended for internal use only.
+        """
+        prompt_ids = {}
+        if self.auto_setup:
+            for start in range(0, len(names), _BULK_CHUNK_SIZE):
+                chunk = names[start:start + _BULK_CHUNK_SIZE]
+                placeholders = ", ".join([self._placeholder] * len(chunk))
+                self.cursor.execute(
+                    f"SELECT prompt_name, id FROM {self.prompts_table} WHERE prompt_name IN ({placeholders});",
+                    chunk
+                )
+                prompt_ids.update(self.cursor.fetchall())
+            return prompt_ids
+
+        for name in names:
+            row = self._run_query("get_prompt_id_by_name", {"prompt_name": name}, fetch="one")
+            if row:
+                prompt_ids[name] = row[0]
+        return prompt_ids
 
     def get_prompt(self, prompt_name: str, version: Optional[str] = None,
                    params: Optional[Dict[str, str]] = None) -> str:
@@ -277,48 +801,105 @@ class PromptSuiteSQL:
             RuntimeError: If the prompt or version is not found or required parameters are missing.
         """
         try:
-            # Get the full prompt record
-            prompt = self._run_query("get_prompt_by_name", {"prompt_name": prompt_name}, fetch="one")
-            if not prompt:
-                raise RuntimeError(f"Prompt '{prompt_name}' not found.")
+            if self._prompt_cache_size:
+                key = (prompt_name, version or None)
+                cache = self._prompt_cache
+                cached = cache.get(key)
+                if cached is not None:
+                    cache.move_to_end(key)
+                    self._prompt_cache_hits += 1
+                else:
+                    self._prompt_cache_misses += 1
+                    cached = cache[key] = self._fetch_prompt_text(prompt_name, version)
+                    if len(cache) > self._prompt_cache_size:
+                        cache.popitem(last=False)
+                parameters_json, prompt_text = cached
+            else:
+                parameters_json, prompt_text = self._fetch_prompt_text(prompt_name, version)
 
-            prompt_id, prompt_name_db, parameters_json, default_version = prompt
+            # Load expected parameters from stored JSON
+            expected_params = _required_parameters(parameters_json)
 
-            # Select the version to use
-            selected_version = version or default_version
-            if not selected_version:
-                raise RuntimeError(f"No version specified and no default set for prompt '{prompt_name}'.")
+            # Validate and replace parameters
+            if expected_params:
+                if not (params and params.keys() >= expected_params):
+                    # Reported in the declared order, which the set does not keep
+                    declared = _loads_json(parameters_json)
+                    missing = [p for p in declared if p not in params] if params else declared
+                    raise ValueError(f"Missing required parameters: {', '.join(missing)}")
+
+                prompt_text = _fill_placeholders(prompt_text, params)
+
+            return prompt_text
+
+        except Exception as e:
+            raise RuntimeError(f"Error retrieving prompt '{prompt_name}': {e}") from e
+
+    def cache_info(self) -> Dict[str, int]:
+        """
+        Returns statistics of the prompt cache enabled with `prompt_cache_size`.
+
+        Returns:
+            Dict[str, int]: The number of cache "hits" and "misses", the current "size" and the "maxsize".
+        """
+        return {
+            "hits": self._prompt_cache_hits,
+            "misses": self._prompt_cache_misses,
+            "size": len(self._prompt_cache),
+            "maxsize": self._prompt_cache_size,
+        }
+
+    def _fetch_prompt_text(self, prompt_name: str, version: Optional[str]):
+        """
+        Resolves a prompt version from the database, with the 'get_prompt_rendered' query when it is
+        defined and with separate prompt and version queries otherwise.
+
+        This method is intended for internal use only.
 
-            # Get the prompt content for the selected version
-            result = self._run_query("get_version_content", {
-                "prompt_id": prompt_id,
-                "version": selected_version
+        Returns:
+            Tuple[Optional[str], str]: The stored parameters JSON and the prompt text.
+
+        Raises:
+            RuntimeError: If the prompt or version is not found.
+        """
+        if "get_prompt_rendered" in self.queries:
+            # Resolve the prompt, its version and the version content with a single query
+            row = self._run_query("get_prompt_rendered", {
+                "prompt_name": prompt_name,
+                "version": version or None
             }, fetch="one")
+            if not row:
+                raise RuntimeError(f"Prompt '{prompt_name}' not found.")
 
-            if not result:
+            parameters_json, selected_version, prompt_text = row
+            if not selected_version:
+                raise RuntimeError(f"No version specified and no default set for prompt '{prompt_name}'.")
+            if prompt_text is None:
                 raise RuntimeError(f"Version '{selected_version}' not found for prompt '{prompt_name}'.")
+            return parameters_json, prompt_text
 
-            prompt_text = result[0]
+        # Get the full prompt record
+        prompt = self._run_query("get_prompt_by_name", {"prompt_name": prompt_name}, fetch="one")
+        if not prompt:
+            raise RuntimeError(f"Prompt '{prompt_name}' not found.")
 
-            # Load expected parameters from stored JSON
-            expected_params = json.loads(parameters_json or "[]")
+        prompt_id, prompt_name_db, parameters_json, default_version = prompt
 
-            # Validate and replace parameters
-            if expected_params:
-                if not params:
-                    raise ValueError(f"Missing required parameters: {', '.join(expected_params)}")
-
-                missing = [p for p in expected_params if p not in params]
-                if missing:
-                    raise ValueError(f"Missing required parameters: {', '.join(missing)}")
+        # Select the version to use
+        selected_version = version or default_version
+        if not selected_version:
+            raise RuntimeError(f"No version specified and no default set for prompt '{prompt_name}'.")
 
-                for key, value in params.items():
-                    prompt_text = prompt_text.replace(f"{{{key}}}", str(value))
+        # Get the prompt content for the selected version
+        result = self._run_query("get_version_content", {
+            "prompt_id": prompt_id,
+            "version": selected_version
+        }, fetch="one")
 
-            return prompt_text
+        if not result:
+            raise RuntimeError(f"Version '{selected_version}' not found for prompt '{prompt_name}'.")
 
-        except Exception as e:
-            raise RuntimeError(f"Error retrieving prompt '{prompt_name}': {e}")
+        return parameters_json, result[0]
 
     def add_version(self, prompt_name: str, version: str, content: str) -> bool:
         """
@@ -336,32 +917,46 @@ class PromptSuiteSQL:
             RuntimeError: If the prompt does not exist or the version already exists.
         """
         try:
-            # Get the prompt ID
-            prompt = self._run_query("get_prompt_id_by_name", {"prompt_name": prompt_name}, fetch="one")
-            if not prompt:
-                raise RuntimeError(f"Prompt '{prompt_name}' not found.")
-            prompt_id = prompt[0]
+            with self.transaction():
+                if "create_version_if_absent" in self.queries:
+                    # Insert the version in one statement; no row means the prompt or the version is missing
+                    inserted = self._run_query("create_version_if_absent", {
+                        "prompt_name": prompt_name,
+                        "version": version,
+                        "prompt_text": content
+                    }, fetch="one")
+                    if not inserted:
+                        if not self._prompt_exists(prompt_name):
+                            raise RuntimeError(f"Prompt '{prompt_name}' not found.")
+                        raise RuntimeError(f"Version '{version}' already exists for prompt '{prompt_name}'.")
 
-            # Check if the version already exists
-            existing = self._run_query("get_version_content", {
-                "prompt_id": prompt_id,
-                "version": version
-            }, fetch="one")
-            if existing:
-                raise RuntimeError(f"Version '{version}' already exists for prompt '{prompt_name}'.")
+                    return True
 
-            # Insert the new version
-            self._run_query("create_version", {
-                "prompt_id": prompt_id,
-                "version": version,
-                "prompt_text": content
-            })
+                # Get the prompt ID
+                prompt = self._run_query("get_prompt_id_by_name", {"prompt_name": prompt_name}, fetch="one")
+                if not prompt:
+                    raise RuntimeError(f"Prompt '{prompt_name}' not found.")
+                prompt_id = prompt[0]
 
-            self.conn.commit()
-            return True
+                # Check if the version already exists
+                existing = self._run_query("get_version_content", {
+                    "prompt_id": prompt_id,
+                    "version": version
+                }, fetch="one")
+                if existing:
+                    raise RuntimeError(f"Version '{version}' already exists for prompt '{prompt_name}'.")
+
+                # Insert the new version
+                self._run_query("create_version", {
+                    "prompt_id": prompt_id,
+                    "version": version,
+                    "prompt_text": content
+                })
+
+                return True
 
         except Exception as e:
-            raise RuntimeError(f"Error adding version '{version}' to prompt '{prompt_name}': {e}")
+            raise RuntimeError(f"Error adding version '{version}' to prompt '{prompt_name}': {e}") from e
 
     def update_prompt(self, prompt_name: str,
                       versions: Optional[Dict[str, str]] = None,
@@ -383,45 +978,41 @@ class PromptSuiteSQL:
             RuntimeError: If the prompt does not exist or an error occurs.
         """
         try:
-            # Get the prompt info
-            prompt = self._run_query("get_prompt_by_name", {"prompt_name": prompt_name}, fetch="one")
-            if not prompt:
-                raise RuntimeError(f"Prompt '{prompt_name}' not found.")
+            with self.transaction():
+                self._prompt_cache.clear()
 
-            prompt_id, _, parameters_json, current_default = prompt
+                # Get the prompt info
+                prompt = self._run_query("get_prompt_by_name", {"prompt_name": prompt_name}, fetch="one")
+                if not prompt:
+                    raise RuntimeError(f"Prompt '{prompt_name}' not found.")
 
-            # Update parameters and/or default version
-            if parameters is not None or default is not None:
-                param_str = json.dumps(parameters) if parameters is not None else parameters_json
-                default_version = default if default is not None else current_default
+                prompt_id, _, parameters_json, current_default = prompt
 
-                self._run_query("update_prompt", {
-                    "parameters": param_str,
-                    "default_version": default_version,
-                    "id": prompt_id
-                })
+                # Update parameters and/or default version
+                if parameters is not None or default is not None:
+                    param_str = _dumps_json(parameters) if parameters is not None else parameters_json
+                    default_version = default if default is not None else current_default
 
-            # Add new versions if provided
-            if versions:
-                for version, text in versions.items():
-                    existing = self._run_query("get_version_content", {
-                        "prompt_id": prompt_id,
-                        "version": version
-                    }, fetch="one")
-                    if existing:
-                        continue  # skip if version already exists
-
-                    self._run_query("create_version", {
-                        "prompt_id": prompt_id,
-                        "version": version,
-                        "prompt_text": text
+                    self._run_query("update_prompt", {
+                        "parameters": param_str,
+                        "default_version": default_version,
+                        "id": prompt_id
                     })
 
-            self.conn.commit()
-            return True
+                # Add new versions if provided, skipping the ones that already exist
+                if versions:
+                    existing = set(self._run_query("get_versions_by_prompt", {"prompt_id": prompt_id}, fetch="col0"))
+                    new_versions = [
+                        {"prompt_id": prompt_id, "version": version, "prompt_text": text}
+                        for version, text in versions.items() if version not in existing
+                    ]
+                    if new_versions:
+                        self._run_many("create_version", new_versions)
+
+                return True
 
         except Exception as e:
-            raise RuntimeError(f"Error updating prompt '{prompt_name}': {e}")
+            raise RuntimeError(f"Error updating prompt '{prompt_name}': {e}") from e
 
     def rename_prompt(self, old_name: str, new_name: str) -> bool:
         """
@@ -438,25 +1029,27 @@ class PromptSuiteSQL:
             RuntimeError: If the old prompt does not exist or the new name is already taken.
         """
         try:
-            # Ensure the old prompt exists
-            if not self._run_query("get_prompt_by_name", {"prompt_name": old_name}, fetch="one"):
-                raise RuntimeError(f"Prompt '{old_name}' not found.")
+            with self.transaction():
+                self._prompt_cache.clear()
 
-            # Ensure the new name is not already used
-            if self._run_query("get_prompt_by_name", {"prompt_name": new_name}, fetch="one"):
-                raise RuntimeError(f"A prompt with the name '{new_name}' already exists.")
+                # Ensure the old prompt exists
+                if not self._prompt_exists(old_name):
+                    raise RuntimeError(f"Prompt '{old_name}' not found.")
 
-            # Rename the prompt
-            self._run_query("rename_prompt", {
-                "old_name": old_name,
-                "new_name": new_name
-            })
+                # Ensure the new name is not already used
+                if self._prompt_exists(new_name):
+                    raise RuntimeError(f"A prompt with the name '{new_name}' already exists.")
 
-            self.conn.commit()
-            return True
+                # Rename the prompt
+                self._run_query("rename_prompt", {
+                    "old_name": old_name,
+                    "new_name": new_name
+                })
+
+                return True
 
         except Exception as e:
-            raise RuntimeError(f"Error renaming prompt '{old_name}' to '{new_name}': {e}")
+            raise RuntimeError(f"Error renaming prompt '{old_name}' to '{new_name}': {e}") from e
 
     def delete_prompt(self, prompt_name: str) -> bool:
         """
@@ -472,18 +1065,55 @@ class PromptSuiteSQL:
             RuntimeError: If the prompt does not exist or deletion fails.
         """
         try:
-            # Confirm the prompt exists
-            if not self._run_query("get_prompt_by_name", {"prompt_name": prompt_name}, fetch="one"):
-                raise RuntimeError(f"Prompt '{prompt_name}' not found.")
+            with self.transaction():
+                self._prompt_cache.clear()
 
-            # Delete the prompt
-            self._run_query("delete_prompt", {"prompt_name": prompt_name})
+                # Confirm the prompt exists
+                if not self._prompt_exists(prompt_name):
+                    raise RuntimeError(f"Prompt '{prompt_name}' not found.")
 
-            self.conn.commit()
-            return True
+                # Delete the prompt
+                self._run_query("delete_prompt", {"prompt_name": prompt_name})
+
+                return True
+
+        except Exception as e:
+            raise RuntimeError(f"Error deleting prompt '{prompt_name}': {e}") from e
+
+    def delete_prompts(self, prompt_names: List[str]) -> bool:
+        """
+        Deletes several prompts and all their versions at once, in a single transaction.
+
+        Each name is checked with an indexed existence query, and the prompts are removed with one
+        executemany call, instead of a commit per prompt. If any prompt does not exist, none of them is
+        deleted.
+
+        Args:
+            prompt_names (List[str]): The names of the prompts to delete.
+
+        Returns:
+            bool: True if all prompts were successfully deleted.
+
+        Raises:
+            RuntimeError: If a prompt does not exist or deletion fails.
+        """
+        try:
+            names = list(dict.fromkeys(prompt_names))
+            with self.transaction():
+                self._prompt_cache.clear()
+
+                # Confirm every prompt exists
+                for name in names:
+                    if not self._prompt_exists(name):
+                        raise RuntimeError(f"Prompt '{name}' not found.")
+
+                # Delete all prompts in one batch
+                self._run_many("delete_prompt", [{"prompt_name": name} for name in names])
+
+                return True
 
         except Exception as e:
-            raise RuntimeError(f"Error deleting prompt '{prompt_name}': {e}")
+            raise RuntimeError(f"Error deleting prompts: {e}") from e
 
     def list_versions(self, prompt_name: str) -> List[str]:
         """
@@ -506,11 +1136,10 @@ class PromptSuiteSQL:
             prompt_id = prompt[0]
 
             # Fetch versions associated with the prompt
-            results = self._run_query("get_versions_by_prompt", {"prompt_id": prompt_id}, fetch="all")
-            return [row[0] for row in results] if results else []
+            return self._run_query("get_versions_by_prompt", {"prompt_id": prompt_id}, fetch="col0")
 
         except Exception as e:
-            raise RuntimeError(f"Error listing versions for prompt '{prompt_name}': {e}")
+            raise RuntimeError(f"Error listing versions for prompt '{prompt_name}': {e}") from e
 
     def get_default_version(self, prompt_name: str) -> str:
         """
@@ -537,7 +1166,7 @@ class PromptSuiteSQL:
             return default_version
 
         except Exception as e:
-            raise RuntimeError(f"Error retrieving default version for prompt '{prompt_name}': {e}")
+            raise RuntimeError(f"Error retrieving default version for prompt '{prompt_name}': {e}") from e
 
     def list_prompts(self) -> List[str]:
         """
@@ -550,9 +1179,66 @@ class PromptSuiteSQL:
             RuntimeError: If the query fails.
         """
         try:
-            results = self._run_query("get_all_prompts", {}, fetch="all")
-            return [row[0] for row in results] if results else []
+            return self._run_query("get_all_prompts", {}, fetch="col0")
 
         except Exception as e:
-            raise RuntimeError(f"Error listing prompts: {e}")
+            raise RuntimeError(f"Error listing prompts: {e}") from e
+
+    def export_prompts(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns every prompt with all its versions, fetched with a single query.
+
+        The result uses the same structure as the YAML/JSON files handled by `PromptSuite`, so it can be
+        used to inspect the whole catalog or to export it without one query per prompt.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Prompt name → {"name", "parameters", "versions"} plus "default" when
+            one is set, where "versions" maps each version name to {"prompt": prompt_text}.
 
+        Raises:
+            RuntimeError: If the query fails.
+        """
+        try:
+            rows = self._run_query("get_all_prompts_with_versions", {}, fetch="iter")
+            prompts = {}
+            for prompt_name, parameters_json, default_version, version, prompt_text in rows:
+                prompt = prompts.get(prompt_name)
+                if prompt is None:
+                    prompt = prompts[prompt_name] = {
+                        "name": prompt_name,
+                        "parameters": _loads_json(parameters_json or "[]"),
+                        "versions": {}
+                    }
+                    if default_version:
+                        prompt["default"] = default_version
+                if version is not None:
+                    prompt["versions"][version] = {"prompt": prompt_text}
+            return prompts
+
+        except Exception as e:
+            raise RuntimeError(f"Error exporting prompts: {e}") from e
+
+    def get_all_default_prompts(self) -> Dict[str, Tuple[List[str], Optional[str], Optional[str]]]:
+        """
+        Returns the default version of every prompt, fetched with a single query.
+
+        Use it instead of calling `get_prompt` once per name from `list_prompts` when many prompts are
+        needed at once; the texts are returned unrendered, so fill in their parameters as needed.
+
+        Returns:
+            Dict[str, Tuple[List[str], Optional[str], Optional[str]]]: Prompt name → (parameters,
+            default version, default version text). The version and text are None when the prompt has
+            no default set, and the text is None when the default version does not exist.
+
+        Raises:
+            RuntimeError: If the query fails.
+        """
+        try:
+            rows = self._run_query("get_all_default_prompts", {}, fetch="iter")
+            return {
+                prompt_name: (_loads_json(parameters_json or "[]"), default_version, prompt_text)
+                for prompt_name, parameters_json, default_version, prompt_text in rows
+            }
+
+        except Exception as e:
+            raise RuntimeError(f"Error retrieving default prompts: {e}") from e
@@ -6,9 +6,11 @@ setup(
     packages=find_packages(),
     install_requires=[
         "pyyaml>=6.0.1",
-        "pydantic>=2.5.2",
         "psycopg2-binary>=2.9.9",  # Para soporte de PostgreSQL
     ],
+    extras_require={
+        "fast": ["orjson>=3.9"],
+    },
     author="Marc Mayol",
     author_email="marcmyolorell@gmail.com",
     description="Prompt Suite is a library focused on prompt management, based on the idea that prompts are not just text,they are code. It allows you to store your prompts by model, keep version control, and save everything in YAML, JSON, or SQL. It also includes a powerful placeholder system to help you dynamically complete your prompts.",